@@ -5,13 +5,19 @@ folder_md_converter.py - Convert between folder structures and markdown represen
 
 import os
 import sys
-import argparse
-import re
+
+# Files and directories skipped by default when scanning
+_DEFAULT_IGNORE = frozenset({'.git', '__pycache__', 'node_modules', '.DS_Store'})
+
+# Characters that may appear in a tree line before the ├──/└── connector.
+# str.lstrip with an explicit char set is a C-level scan over the
+# indentation columns, with no regex engine involved.
+_TREE_PREFIX_CHARS = ' \t│'
 
 
 def scan_directory(directory_path, indent=0, is_last=False, prefix="", ignore_list=None):
     """
-    Recursively scan a directory and generate a markdown representation
+    Scan a directory tree and generate a markdown representation
     
     Args:
         directory_path: Path to the directory to scan
@@ -20,50 +26,75 @@ def scan_directory(directory_path, indent=0, is_last=False, prefix="", ignore_li
         prefix: String prefix for the current line
         ignore_list: List of files/directories to ignore
     
-    Returns:
-        List of strings representing the markdown tree
+    Yields:
+        Strings representing the markdown tree, one line at a time
     """
-    result = []
-    
+    # Freeze the ignore list once so every membership test in the walk is
+    # an O(1) hash lookup rather than a list scan
     if ignore_list is None:
-        ignore_list = ['.git', '__pycache__', 'node_modules', '.DS_Store']
-    
-    # Get the directory name from the path
-    dir_name = os.path.basename(directory_path)
-    if not dir_name:  # For root directory
-        dir_name = directory_path
-    
-    # Generate the line prefix based on indent level
-    if indent == 0:
-        # Root directory
-        line = f"{dir_name}/"
+        ignore_list = _DEFAULT_IGNORE
     else:
-        if is_last:
-            line = f"{prefix}└── {dir_name}/"
+        ignore_list = frozenset(ignore_list)
+
+    # Depth-first walk driven by an explicit stack instead of Python
+    # recursion, avoiding per-directory call-frame overhead on deep trees.
+    # Entries are either (path, indent, is_last, prefix) directories still
+    # to expand, or already-rendered lines (plain strings) to emit.
+    stack = [(directory_path, indent, is_last, prefix)]
+
+    # Bind the hot methods once; attribute lookups inside the loop add up
+    # on large trees
+    stack_append = stack.append
+    stack_pop = stack.pop
+
+    while stack:
+        top = stack_pop()
+        if isinstance(top, str):
+            yield top
+            continue
+
+        dir_path, indent, is_last, prefix = top
+
+        # Get the directory name from the path
+        dir_name = os.path.basename(dir_path)
+        if not dir_name:  # For root directory
+            dir_name = dir_path
+
+        # Generate the line prefix based on indent level
+        if indent == 0:
+            # Root directory
+            yield f"{dir_name}/"
+        elif is_last:
+            yield f"{prefix}└── {dir_name}/"
         else:
-            line = f"{prefix}├── {dir_name}/"
-    
-    result.append(line)
-    
-    try:
-        # Get and sort items in the directory
-        items = sorted(os.listdir(directory_path))
-        
-        # Skip hidden files and ignored directories
-        items = [item for item in items if not item.startswith('.') and 
-                item not in ignore_list]
-        
-        # Separate directories and files
-        dirs = []
-        files = []
-        
-        for item in items:
-            item_path = os.path.join(directory_path, item)
-            if os.path.isdir(item_path):
-                dirs.append(item)
-            else:
-                files.append(item)
-        
+            yield f"{prefix}├── {dir_name}/"
+
+        try:
+            # Get and sort entries; scandir reuses the d_type from the
+            # directory read, so classifying entries needs no extra stat() calls
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+
+            # Skip hidden files and ignored directories; a direct first-char
+            # compare is cheaper than a startswith call per entry
+            entries = [entry for entry in entries if entry.name[0] != '.' and
+                      entry.name not in ignore_list]
+
+            # Separate directories and files
+            dirs = []
+            files = []
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # entry.path is already joined by scandir, saving an
+                    # os.path.join per subdirectory
+                    dirs.append(entry.path)
+                else:
+                    files.append(entry.name)
+        except (PermissionError, FileNotFoundError):
+            yield f"{prefix}│   (Permission denied or not found)"
+            continue
+
         # Set prefixes for children items
         if indent > 0:
             if is_last:
@@ -72,32 +103,16 @@ def scan_directory(directory_path, indent=0, is_last=False, prefix="", ignore_li
                 child_prefix = prefix + "│   "
         else:
             child_prefix = ""
-        
-        # Process directories first
-        for i, d in enumerate(dirs):
+
+        # Push in reverse so the stack yields directories (expanded in
+        # order) first, then this directory's file lines
+        for i in range(len(files) - 1, -1, -1):
+            connector = "└──" if i == len(files) - 1 else "├──"
+            stack_append(f"{child_prefix}{connector} {files[i]}")
+
+        for i in range(len(dirs) - 1, -1, -1):
             is_last_dir = (i == len(dirs) - 1) and not files
-            result.extend(
-                scan_directory(
-                    os.path.join(directory_path, d),
-                    indent + 1,
-                    is_last_dir,
-                    child_prefix,
-                    ignore_list
-                )
-            )
-        
-        # Process files
-        for i, f in enumerate(files):
-            is_last_file = (i == len(files) - 1)
-            if is_last_file:
-                result.append(f"{child_prefix}└── {f}")
-            else:
-                result.append(f"{child_prefix}├── {f}")
-    
-    except (PermissionError, FileNotFoundError):
-        result.append(f"{prefix}│   (Permission denied or not found)")
-    
-    return result
+            stack_append((dirs[i], indent + 1, is_last_dir, child_prefix))
 
 
 def parse_markdown_tree(md_content):
@@ -111,43 +126,63 @@ def parse_markdown_tree(md_content):
         List of paths to create (files and directories)
     """
     paths = []
-    lines = md_content.strip().split('\n')
-    
-    # Process the root directory first
-    if not lines:
-        return paths
-    
-    root = lines[0].rstrip('/')
-    current_path = [root]
-    
-    # For each line after the root
-    for line in lines[1:]:
-        # Detect the indentation level based on the prefix
-        indent_match = re.match(r'^(.*?)[└├]── (.+)$', line)
-        if not indent_match:
+    paths_append = paths.append
+    current_path = None
+    sep = os.sep
+
+    # Single pass over the content: the first non-blank line is the root,
+    # each later line is classified once as a tree entry or skipped.
+    # splitlines avoids the whole-content strip() copy that a
+    # strip().split('\n') pre-pass would make.
+    for line in md_content.splitlines():
+        # Process the root directory first
+        if current_path is None:
+            stripped = line.strip()
+            if stripped:
+                current_path = [stripped.rstrip('/')]
             continue
-            
-        prefix, item = indent_match.groups()
-        
-        # Calculate the indentation level based on the prefix
-        level = (len(prefix) // 4) + 1
-        
-        # Adjust the current path based on the level
-        while len(current_path) > level:
-            current_path.pop()
+
+        # Strip the '│   '/'    ' indentation groups; what's left must start
+        # with a connector to be a tree entry
+        entry = line.lstrip(_TREE_PREFIX_CHARS)
+        if not entry.startswith(('├── ', '└── ')):
+            continue
+
+        item = entry[4:]
+        if not item:
+            continue
+
+        # The indentation groups are 4 columns wide, so the connector's
+        # column gives the level directly
+        level = ((len(line) - len(entry)) // 4) + 1
         
-        # Add the new item to the current path
-        is_dir = item.endswith('/')
+        # current_path only ever grows; components beyond the current level
+        # are stale and simply excluded from the joined slice, so stepping
+        # back up the tree needs no pop-per-level mutation.
+        # The components are bare names, so a plain sep-join builds the
+        # same string as os.path.join without its per-component checks.
+        is_dir = item[-1] == '/'
         if is_dir:
             item = item.rstrip('/')
-            current_path.append(item)
-            paths.append((os.path.join(*current_path), True))
+            if len(current_path) > level:
+                current_path[level] = item
+            else:
+                current_path.append(item)
+            paths_append((sep.join(current_path[:level + 1]), True))
         else:
-            paths.append((os.path.join(*current_path, item), False))
+            paths_append((f"{sep.join(current_path[:level])}{sep}{item}", False))
     
     return paths
 
 
+def _touch(path):
+    """
+    Create an empty file with a single syscall, skipping the io-stack
+    (TextIOWrapper/BufferedWriter) setup that open() would pay per file
+    """
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+
+
 def create_structure(paths, base_dir='.', dry_run=False):
     """
     Create the folder structure based on the parsed paths
@@ -180,23 +215,45 @@ def create_structure(paths, base_dir='.', dry_run=False):
         print("Operation cancelled.")
         return False
     
-    # Create the structure
-    for path, is_dir in paths:
-        full_path = os.path.join(base_dir, path)
-        
+    # Join each path with the base directory once and reuse the result in
+    # both passes below; the separator-terminated base makes each join a
+    # plain concatenation
+    base = os.path.join(base_dir, '')
+    full_paths = [(base + path, is_dir) for path, is_dir in paths]
+
+    # Create each needed directory exactly once: explicit directories plus
+    # the parent of every file. makedirs(exist_ok=True) is already
+    # idempotent, so no exists() pre-check is needed.
+    unique_dirs = set()
+    for full_path, is_dir in full_paths:
         if is_dir:
-            os.makedirs(full_path, exist_ok=True)
-            print(f"Created directory: {full_path}")
+            unique_dirs.add(full_path)
         else:
-            # Create parent directories if they don't exist
-            parent_dir = os.path.dirname(full_path)
-            os.makedirs(parent_dir, exist_ok=True)
-            
-            # Create empty file
-            with open(full_path, 'w') as f:
-                pass
-            print(f"Created file: {full_path}")
-    
+            unique_dirs.add(os.path.dirname(full_path))
+
+    # Sorting by length guarantees parents are created before children
+    for dir_path in sorted(unique_dirs, key=len):
+        os.makedirs(dir_path, exist_ok=True)
+
+    # All parents exist now, so each file is a single open() call
+    file_paths = [full_path for full_path, is_dir in full_paths if not is_dir]
+
+    # The open() syscall releases the GIL, so a thread pool overlaps the
+    # per-file I/O on large structures; small batches stay serial to avoid
+    # paying the pool setup cost
+    if len(file_paths) > 64:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor() as executor:
+            # Drain the iterator so any creation error propagates here
+            list(executor.map(_touch, file_paths))
+    else:
+        for full_path in file_paths:
+            _touch(full_path)
+
+    # The full listing was already printed above; keep per-item prints
+    # (and their stdout flushes) out of the creation loops
+    print(f"Created {len(unique_dirs)} directories and {len(file_paths)} files.")
     print("Structure created successfully.")
     return True
 
@@ -208,15 +265,14 @@ def folder_to_md(args):
     # Generate the markdown tree
     tree_lines = scan_directory(args.directory, ignore_list=args.ignore)
     
-    # Output the result
+    # Stream the lines straight into the sink as the walk produces them;
+    # the handles buffer internally, so memory stays flat on huge trees
     if args.output:
-        with open(args.output, 'w') as f:
-            for line in tree_lines:
-                f.write(line + '\n')
+        with open(args.output, 'wb') as f:
+            f.writelines(f"{line}\n".encode('utf-8') for line in tree_lines)
         print(f"Markdown tree saved to {args.output}")
     else:
-        for line in tree_lines:
-            print(line)
+        sys.stdout.writelines(f"{line}\n" for line in tree_lines)
 
 
 def md_to_folder(args):
@@ -225,8 +281,16 @@ def md_to_folder(args):
     """
     # Read the markdown content
     if args.input:
-        with open(args.input, 'r') as f:
-            md_content = f.read()
+        import mmap
+
+        # Map the file instead of read()-copying it through the io stack;
+        # an empty file can't be mapped, so fall back to a plain read
+        with open(args.input, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    md_content = mm[:].decode('utf-8')
+            except ValueError:
+                md_content = f.read().decode('utf-8')
     else:
         print("Enter the markdown tree representation (Ctrl+D to finish):")
         md_content = sys.stdin.read()
@@ -239,6 +303,10 @@ def md_to_folder(args):
 
 
 def main():
+    # Imported here so library use of this module doesn't pay the
+    # argparse import cost
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Convert between folder structures and markdown tree representations'
     )